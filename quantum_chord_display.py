@@ -25,22 +25,30 @@ def cosine_sim(a: np.ndarray, b: np.ndarray) -> float:
     if na < 1e-9 or nb < 1e-9: return 0.0
     return float(np.dot(a, b) / (na * nb))
 
+BASE_MAJ = np.array([1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0], dtype=np.float32)
+BASE_MIN = np.array([1, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0], dtype=np.float32)
+
+CHORD_NAMES: Tuple[str, ...] = tuple(NOTE_NAMES) + tuple(n + "m" for n in NOTE_NAMES)
+
+def build_template_matrix() -> np.ndarray:
+    # Every template is a circular shift of the root-position triad; rows follow CHORD_NAMES
+    maj = np.stack([np.roll(BASE_MAJ, r) for r in range(12)])
+    mi = np.stack([np.roll(BASE_MIN, r) for r in range(12)])
+    return np.vstack([maj, mi])
+
 def build_chord_templates() -> Dict[str, np.ndarray]:
-    t: Dict[str, np.ndarray] = {}
-    for r in range(12):
-        maj = np.zeros(12, dtype=np.float32)
-        maj[r] = 1.0
-        maj[(r + 4) % 12] = 1.0
-        maj[(r + 7) % 12] = 1.0
-        mi = np.zeros(12, dtype=np.float32)
-        mi[r] = 1.0
-        mi[(r + 3) % 12] = 1.0
-        mi[(r + 7) % 12] = 1.0
-        t[f"{NOTE_NAMES[r]}"] = maj
-        t[f"{NOTE_NAMES[r]}m"] = mi
-    return t
-
-TEMPLATES = build_chord_templates()
+    return dict(zip(CHORD_NAMES, build_template_matrix()))
+
+TEMPLATES = build_chord_templates()  # name -> template, for debugging only
+TEMPLATE_MATRIX = build_template_matrix()
+# Unit rows, so TEMPLATE_MATRIX @ chroma / |chroma| is cosine_sim per template
+TEMPLATE_MATRIX /= np.linalg.norm(TEMPLATE_MATRIX, axis=1, keepdims=True) + 1e-12
+
+def best_chord(chroma: np.ndarray) -> Tuple[str, float]:
+    c = np.maximum(chroma, 0.0).astype(np.float32, copy=False)
+    scores = (TEMPLATE_MATRIX @ c) / (float(np.linalg.norm(c)) + 1e-12)
+    i = int(scores.argmax())
+    return CHORD_NAMES[i], float(scores[i])
 
 if __name__ == "__main__":
     print("Quantum Chord Display - Ready!")